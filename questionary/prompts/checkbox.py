@@ -205,9 +205,14 @@ def checkbox(
 
     @bindings.add(Keys.ControlQ, eager=True)
     @bindings.add(Keys.ControlC, eager=True)
-    def _(event):
+    def abort(event):
         event.app.exit(exception=KeyboardInterrupt, style="class:aborting")
 
+    # older prompt_toolkit versions have no SIGINT key, there the signal is handled
+    # by ``Question.ask_async`` instead
+    if hasattr(Keys, "SIGINT"):
+        bindings.add(Keys.SIGINT, eager=True)(abort)
+
     @bindings.add(" ", eager=True)
     def toggle(_event):
         pointed_choice = ic.get_pointed_at().value
@@ -188,9 +188,14 @@ def select(
 
     @bindings.add(Keys.ControlQ, eager=True)
     @bindings.add(Keys.ControlC, eager=True)
-    def _(event):
+    def abort(event):
         event.app.exit(exception=KeyboardInterrupt, style="class:aborting")
 
+    # older prompt_toolkit versions have no SIGINT key, there the signal is handled
+    # by ``Question.ask_async`` instead
+    if hasattr(Keys, "SIGINT"):
+        bindings.add(Keys.SIGINT, eager=True)(abort)
+
     if use_shortcuts:
         # add key bindings for choices
         for i, c in enumerate(ic.choices):
@@ -1,7 +1,12 @@
 from __future__ import annotations
 
+import asyncio
+import contextlib
+import signal
 import sys
 from typing import Any
+from typing import Awaitable
+from typing import Iterator
 
 import prompt_toolkit.patch_stdout
 from prompt_toolkit import Application
@@ -9,6 +14,66 @@ from prompt_toolkit import Application
 from questionary import utils
 from questionary.constants import DEFAULT_KBI_MESSAGE
 
+_IS_PTK3 = utils.IS_PROMPT_TOOLKIT_3
+
+# newer prompt_toolkit releases deliver SIGINT to the application as a ``<sigint>``
+# key press, which the prompts bind to the same abort as ``ctrl-c``
+_APPLICATION_HANDLES_SIGINT = "handle_sigint" in utils.arguments_of(
+    Application.run_async
+)
+
+# pick the way to run an application asynchronously once, instead of checking the
+# prompt_toolkit version on every prompt
+if _IS_PTK3:
+
+    def _run_application_async(application: "Application[Any]") -> Awaitable[Any]:
+        return application.run_async()
+
+else:
+
+    def _run_application_async(application: "Application[Any]") -> Awaitable[Any]:
+        # prompt_toolkit 2 returns its own future type, which asyncio can't await
+        return application.run_async().to_asyncio_future()  # type: ignore[attr-defined]
+
+
+@contextlib.contextmanager
+def _exit_on_sigint(application: "Application[Any]") -> Iterator[None]:
+    """Exit ``application`` with a KeyboardInterrupt when SIGINT is received.
+
+    The running event loop handles the signal, so the interrupt ends the prompt the
+    same way ``ctrl-c`` does instead of being raised wherever the interpreter happens
+    to be. Does nothing if prompt_toolkit already delivers SIGINT as a ``<sigint>``
+    key press (handled by the prompts' key bindings), if the application registered
+    its own SIGINT handler on the loop, or where the loop can't handle signals (e.g.
+    on Windows or outside of the main thread)."""
+
+    loop = asyncio.get_running_loop()
+    # asyncio has no public way to look up a loop's signal handlers. Replacing one
+    # would lose it for good, as removing ours doesn't bring the previous one back.
+    if _APPLICATION_HANDLES_SIGINT or signal.SIGINT in getattr(
+        loop, "_signal_handlers", {}
+    ):
+        yield
+        return
+
+    def interrupt() -> None:
+        if application.is_running and not application.is_done:
+            application.exit(exception=KeyboardInterrupt, style="class:aborting")
+
+    previous_handler = signal.getsignal(signal.SIGINT)
+    try:
+        loop.add_signal_handler(signal.SIGINT, interrupt)
+    except (NotImplementedError, RuntimeError, ValueError):
+        yield
+        return
+
+    try:
+        yield
+    finally:
+        loop.remove_signal_handler(signal.SIGINT)
+        if previous_handler is not None:
+            signal.signal(signal.SIGINT, previous_handler)
+
 
 def handle_kbi(
     kbi_msg: str | None = DEFAULT_KBI_MESSAGE,
@@ -26,16 +91,14 @@ def handle_kbi(
 
         exit_on_kbi: Exit the program when a KeyboardInterrupt is received in a prompt if True
     """
-    if exit_on_kbi is True:
-        exit(0)
-    elif (not isinstance(exit_on_kbi, bool)) and isinstance(exit_on_kbi, int):
-        exit(exit_on_kbi)
-    elif raise_on_kbi:
+    # ``exit_on_kbi`` may also be an int exit code (``bool`` is a subclass of ``int``)
+    if exit_on_kbi is not False and isinstance(exit_on_kbi, int):
+        exit(0 if exit_on_kbi is True else exit_on_kbi)
+    if raise_on_kbi:
         raise KeyboardInterrupt()
-    else:
-        if kbi_msg:
-            print(f"\n{kbi_msg}\n")
-        return None
+    if kbi_msg:
+        sys.stdout.write(f"\n{kbi_msg}\n\n")
+    return None
 
 
 class Question:
@@ -64,7 +127,8 @@ class Question:
 
         Args:
             patch_stdout: Ensure that the prompt renders correctly if other threads
-                          are printing to stdout.
+                          are printing to stdout. Pending output is flushed (without
+                          blocking the event loop) before stdout is patched.
 
             kbi_msg: The message to be printed on a keyboard interrupt (or None to not print a message).
 
@@ -76,10 +140,22 @@ class Question:
             `Any`: The answer from the question.
         """
 
+        if self.should_skip_question:
+            return self.default
+
         try:
-            sys.stdout.flush()
-            return await self.unsafe_ask_async(patch_stdout)
+            if patch_stdout:
+                # pending output has to be written before stdout gets patched,
+                # otherwise prompt_toolkit writes it out around the prompt. The flush
+                # runs in a worker thread so other tasks can proceed while it blocks.
+                loop = asyncio.get_running_loop()
+                await loop.run_in_executor(None, sys.stdout.flush)
+            with _exit_on_sigint(self.application):
+                return await self.unsafe_ask_async(patch_stdout)
         except KeyboardInterrupt:
+            if raise_on_kbi and exit_on_kbi is False:
+                # re-raise the original interrupt, keeping its traceback
+                raise
             return handle_kbi(
                 kbi_msg=kbi_msg, exit_on_kbi=exit_on_kbi, raise_on_kbi=raise_on_kbi
             )
@@ -110,6 +186,9 @@ class Question:
         try:
             return self.unsafe_ask(patch_stdout)
         except KeyboardInterrupt:
+            if raise_on_kbi and exit_on_kbi is False:
+                # re-raise the original interrupt, keeping its traceback
+                raise
             return handle_kbi(
                 kbi_msg=kbi_msg, exit_on_kbi=exit_on_kbi, raise_on_kbi=raise_on_kbi
             )
@@ -167,16 +246,14 @@ class Question:
         if self.should_skip_question:
             return self.default
 
-        if not utils.ACTIVATED_ASYNC_MODE:
-            await utils.activate_prompt_toolkit_async_mode()
+        # prompt_toolkit 3 always runs on asyncio, only 2.x needs to be switched to it
+        if not _IS_PTK3:
+            utils.activate_prompt_toolkit_async_mode()
 
         if patch_stdout:
             with prompt_toolkit.patch_stdout.patch_stdout():
-                r = self.application.run_async()
+                r = _run_application_async(self.application)
         else:
-            r = self.application.run_async()
+            r = _run_application_async(self.application)
 
-        if utils.is_prompt_toolkit_3():
-            return await r
-        else:
-            return await r.to_asyncio_future()  # type: ignore[attr-defined]
+        return await r
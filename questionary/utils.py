@@ -1,48 +1,122 @@
 from __future__ import annotations
 
+import functools
 import inspect
-from typing import Any
-from typing import Callable
-from typing import Dict
-from typing import List
-from typing import Set
-from typing import cast
+import weakref
+from typing import TYPE_CHECKING
+from typing import NamedTuple
+from typing import TypeVar
 
+from prompt_toolkit import __version__ as ptk_version
 from prompt_toolkit import print_formatted_text
 from prompt_toolkit.formatted_text import FormattedText
+from prompt_toolkit.styles import BaseStyle
 from prompt_toolkit.styles import Style
 from prompt_toolkit.styles import merge_styles
 
 from questionary.constants import DEFAULT_STYLE
 
-ACTIVATED_ASYNC_MODE = False
+if TYPE_CHECKING:
+    from typing import Any
+    from typing import Callable
+
+IS_PROMPT_TOOLKIT_3 = ptk_version.startswith("3.")
+
+
+class _AsyncState:
+    """Whether prompt toolkit has been configured to use the asyncio event loop."""
+
+    # prompt toolkit 3 always uses asyncio, so there is nothing left to activate
+    activated = IS_PROMPT_TOOLKIT_3
+
+
+T = TypeVar("T")
+
+_QMARK = ("class:qmark", "?")
+
+_EMPTY = inspect.Parameter.empty
+_POSITIONAL_OR_KEYWORD = inspect.Parameter.POSITIONAL_OR_KEYWORD
 
 
 def is_prompt_toolkit_3() -> bool:
-    from prompt_toolkit import __version__ as ptk_version
+    return IS_PROMPT_TOOLKIT_3
+
+
+def _cache_per_callable(
+    compute: Callable[[Callable[..., Any]], T]
+) -> Callable[[Callable[..., Any]], T]:
+    """Memoize ``compute`` - a function taking a callable - once per callable.
+
+    Callables are referenced weakly, so short-lived ones (e.g. closures or
+    ``functools.partial`` objects) are not kept alive by the cache. Callables which
+    cannot be weakly referenced or hashed are recomputed on every call."""
+
+    cache: weakref.WeakKeyDictionary[
+        Callable[..., Any], T
+    ] = weakref.WeakKeyDictionary()
+
+    @functools.wraps(compute)
+    def cached(func: Callable[..., Any]) -> T:
+        try:
+            return cache[func]
+        except KeyError:
+            pass
+        except TypeError:
+            return compute(func)
+
+        result = cache[func] = compute(func)
+        return result
+
+    return cached
+
+
+class _ParamInfo(NamedTuple):
+    """Parameter names of a callable, classified once when it is first inspected."""
 
-    return ptk_version.startswith("3.")
+    arguments: tuple[str, ...]
+    defaulted: tuple[str, ...]
+    required: tuple[str, ...]
+    argument_set: frozenset[str]
+    required_set: frozenset[str]
 
 
-def default_values_of(func: Callable[..., Any]) -> List[str]:
+@_cache_per_callable
+def _param_info(func: Callable[..., Any]) -> _ParamInfo:
+    """Classify the parameters of ``func`` in a single pass over its signature."""
+
+    arguments = []
+    defaulted = []
+    for k, v in inspect.signature(func).parameters.items():
+        arguments.append(k)
+        if v.default is not _EMPTY or v.kind != _POSITIONAL_OR_KEYWORD:
+            defaulted.append(k)
+
+    # required arguments are all arguments minus as many trailing ones as there are
+    # defaulted ones, which is what ``required_arguments`` has always returned
+    required = arguments[: len(arguments) - len(defaulted)]
+
+    return _ParamInfo(
+        arguments=tuple(arguments),
+        defaulted=tuple(defaulted),
+        required=tuple(required),
+        argument_set=frozenset(arguments),
+        required_set=frozenset(required),
+    )
+
+
+def default_values_of(func: Callable[..., Any]) -> list[str]:
     """Return all parameter names of ``func`` with a default value."""
 
-    signature = inspect.signature(func)
-    return [
-        k
-        for k, v in signature.parameters.items()
-        if v.default is not inspect.Parameter.empty
-        or v.kind != inspect.Parameter.POSITIONAL_OR_KEYWORD
-    ]
+    return list(_param_info(func).defaulted)
 
 
-def arguments_of(func: Callable[..., Any]) -> List[str]:
+def arguments_of(func: Callable[..., Any]) -> list[str]:
     """Return the parameter names of the function ``func``."""
 
-    return list(inspect.signature(func).parameters.keys())
+    return list(_param_info(func).arguments)
 
 
-def used_kwargs(kwargs: Dict[str, Any], func: Callable[..., Any]) -> Dict[str, Any]:
+def used_kwargs(kwargs: dict[str, Any], func: Callable[..., Any]) -> dict[str, Any]:
     """Returns only the kwargs which can be used by a function.
 
     Args:
@@ -53,45 +127,71 @@ def used_kwargs(kwargs: Dict[str, Any], func: Callable[..., Any]) -> Dict[str, A
         Subset of kwargs which are accepted by ``func``.
     """
 
-    possible_arguments = arguments_of(func)
+    possible_arguments = _param_info(func).argument_set
 
     return {k: v for k, v in kwargs.items() if k in possible_arguments}
 
 
-def required_arguments(func: Callable[..., Any]) -> List[str]:
+def required_arguments(func: Callable[..., Any]) -> list[str]:
     """Return all arguments of a function that do not have a default value."""
-    defaults = default_values_of(func)
-    args = arguments_of(func)
 
-    if defaults:
-        args = args[: -len(defaults)]
-    return args  # all args without default values
+    return list(_param_info(func).required)
 
 
-def missing_arguments(func: Callable[..., Any], argdict: Dict[str, Any]) -> Set[str]:
+def missing_arguments(
+    func: Callable[..., Any], argdict: dict[str, Any]
+) -> frozenset[str]:
     """Return all arguments that are missing to call func."""
-    return set(required_arguments(func)) - set(argdict.keys())
+    return _param_info(func).required_set.difference(argdict)
 
 
-async def activate_prompt_toolkit_async_mode() -> None:
+def activate_prompt_toolkit_async_mode() -> None:
     """Configure prompt toolkit to use the asyncio event loop.
 
-    Needs to be async, so we use the right event loop in py 3.5"""
-    global ACTIVATED_ASYNC_MODE
+    Called from within a running coroutine, so prompt toolkit picks up the running
+    event loop. Only configures prompt toolkit once, later calls do nothing."""
+
+    if _AsyncState.activated:
+        return
+
+    # Tell prompt_toolkit to use asyncio for the event loop.
+    import prompt_toolkit as pt
+
+    pt.eventloop.use_asyncio_event_loop()  # type: ignore[attr-defined]
 
-    if not is_prompt_toolkit_3():
-        # Tell prompt_toolkit to use asyncio for the event loop.
-        import prompt_toolkit as pt
+    _AsyncState.activated = True
 
-        pt.eventloop.use_asyncio_event_loop()  # type: ignore[attr-defined]
 
-    ACTIVATED_ASYNC_MODE = True
+@functools.lru_cache(maxsize=1)
+def _merge_with_default(style: Style) -> BaseStyle:
+    """Merge ``style`` with the default style.
+
+    Remembers the last merged style, as consecutive prints almost always use the same
+    style object."""
+
+    return merge_styles([DEFAULT_STYLE, style])
+
+
+@functools.lru_cache(maxsize=256)
+def _question_answer_text(question: str, answer: str) -> FormattedText:
+    """Build the formatted text ``print_question_answer`` prints.
+
+    Cached, so printing the same question and answer again reuses the text."""
+
+    return FormattedText(
+        [
+            _QMARK,
+            ("class:question", f" {question} "),
+            ("class:answer", f"{answer} "),
+        ]
+    )
 
 
 def print_question_answer(
     question: str,
     answer: str,
     style: Style | None = None,
+    merged_style: BaseStyle | None = None,
 ) -> None:
     """Print a question and answer in the same style as questionary would print it after the user has provided the
     answer to a prompt. This is helpful for outputting a list of questions/answers, where some of them have
@@ -101,14 +201,15 @@ def print_question_answer(
         question: Prompt question.
         answer: Prompt answer.
         style: prompt-toolkit style to use for output formatting.
+        merged_style: Style which has already been merged with the default style (e.g. using
+                      :func:`questionary.styles.merge_styles_default`). Takes precedence over
+                      ``style``, so that many answers can be printed without merging styles again.
     """
+    if merged_style is None:
+        merged_style = DEFAULT_STYLE if style is None else _merge_with_default(style)
+
+    # answers are not necessarily strings (e.g. a list of selected choices), format
+    # them so they can be used as cache keys
     print_formatted_text(
-        FormattedText(
-            [
-                ("class:qmark", "?"),
-                ("class:question", f" {question} "),
-                ("class:answer", f"{answer} "),
-            ]
-        ),
-        style=merge_styles([DEFAULT_STYLE, cast(Style, style)]),
+        _question_answer_text(f"{question}", f"{answer}"), style=merged_style
     )
@@ -1,11 +1,22 @@
 import asyncio
+import os
 import platform
+import signal
+from unittest.mock import Mock
 
 import pytest
+from prompt_toolkit.keys import Keys
 from prompt_toolkit.output import DummyOutput
 from pytest import fail
 
+from questionary import checkbox
+from questionary import confirm
+from questionary import press_any_key_to_continue
+from questionary import question as question_module
+from questionary import rawselect
+from questionary import select
 from questionary import text
+from questionary.question import handle_kbi
 from questionary.utils import is_prompt_toolkit_3
 from tests.utils import KeyInputs
 from tests.utils import execute_with_input_pipe
@@ -24,6 +35,36 @@ def test_ask_should_catch_keyboard_exception():
     execute_with_input_pipe(run)
 
 
+def test_ask_should_raise_keyboard_exception():
+    def run(inp):
+        inp.send_text(KeyInputs.CONTROLC)
+        question = text("Hello?", input=inp, output=DummyOutput())
+        with pytest.raises(KeyboardInterrupt):
+            question.ask(raise_on_kbi=True)
+
+    execute_with_input_pipe(run)
+
+
+def test_handle_kbi_prints_message(capsys):
+    assert handle_kbi(kbi_msg="Bye") is None
+    assert capsys.readouterr().out == "\nBye\n\n"
+
+    assert handle_kbi(kbi_msg=None) is None
+    assert capsys.readouterr().out == ""
+
+
+def test_handle_kbi_raises():
+    with pytest.raises(KeyboardInterrupt):
+        handle_kbi(raise_on_kbi=True)
+
+
+@pytest.mark.parametrize("exit_on_kbi, code", [(True, 0), (0, 0), (3, 3)])
+def test_handle_kbi_exits(exit_on_kbi, code):
+    with pytest.raises(SystemExit) as e:
+        handle_kbi(raise_on_kbi=True, exit_on_kbi=exit_on_kbi)
+    assert e.value.code == code
+
+
 def test_skipping_of_questions():
     def run(inp):
         question = text("Hello?", input=inp, output=DummyOutput()).skip_if(
@@ -86,6 +127,117 @@ def test_async_ask_question():
     execute_with_input_pipe(run)
 
 
+@pytest.mark.skipif(
+    not is_prompt_toolkit_3(),
+    reason="prompt_toolkit 2 stays bound to the event loop of the first async prompt",
+)
+def test_async_ask_question_with_patch_stdout():
+    loop = asyncio.new_event_loop()
+
+    def run(inp):
+        inp.send_text("World" + KeyInputs.ENTER + "\r")
+        question = text("Hello?", input=inp, output=DummyOutput())
+        response = loop.run_until_complete(question.ask_async(patch_stdout=True))
+        assert response == "World"
+
+    execute_with_input_pipe(run)
+
+
+@pytest.mark.skipif(
+    platform.system() == "Windows", reason="requires loop signal handlers"
+)
+@pytest.mark.skipif(
+    not hasattr(Keys, "SIGINT"), reason="requires prompt_toolkit with a SIGINT key"
+)
+@pytest.mark.parametrize(
+    "create_question",
+    [
+        lambda **kwargs: text("Hello?", **kwargs),
+        lambda **kwargs: confirm("Hello?", **kwargs),
+        lambda **kwargs: select("Hello?", choices=["a", "b"], **kwargs),
+        lambda **kwargs: rawselect("Hello?", choices=["a", "b"], **kwargs),
+        lambda **kwargs: checkbox("Hello?", choices=["a", "b"], **kwargs),
+        lambda **kwargs: press_any_key_to_continue(**kwargs),
+    ],
+    ids=["text", "confirm", "select", "rawselect", "checkbox", "press_any_key"],
+)
+def test_async_ask_should_catch_sigint(capsys, create_question):
+    loop = asyncio.new_event_loop()
+    previous_handler = signal.getsignal(signal.SIGINT)
+
+    def run(inp):
+        question = create_question(input=inp, output=DummyOutput())
+        loop.call_later(0.1, os.kill, os.getpid(), signal.SIGINT)
+        response = loop.run_until_complete(
+            asyncio.wait_for(question.ask_async(kbi_msg="Bye"), timeout=2)
+        )
+        assert response is None
+
+    execute_with_input_pipe(run)
+
+    assert "Bye" in capsys.readouterr().out
+    assert signal.getsignal(signal.SIGINT) is previous_handler
+
+
+@pytest.mark.skipif(
+    platform.system() == "Windows", reason="requires loop signal handlers"
+)
+def test_exit_on_sigint(monkeypatch):
+    monkeypatch.setattr(question_module, "_APPLICATION_HANDLES_SIGINT", False)
+    application = Mock(is_running=True, is_done=False)
+    previous_handler = signal.getsignal(signal.SIGINT)
+
+    async def interrupt():
+        with question_module._exit_on_sigint(application):
+            os.kill(os.getpid(), signal.SIGINT)
+            await asyncio.sleep(0.1)
+
+    asyncio.new_event_loop().run_until_complete(interrupt())
+
+    application.exit.assert_called_once_with(
+        exception=KeyboardInterrupt, style="class:aborting"
+    )
+    assert signal.getsignal(signal.SIGINT) is previous_handler
+
+
+@pytest.mark.skipif(
+    platform.system() == "Windows", reason="requires loop signal handlers"
+)
+def test_exit_on_sigint_keeps_loop_handler(monkeypatch):
+    monkeypatch.setattr(question_module, "_APPLICATION_HANDLES_SIGINT", False)
+    application = Mock(is_running=True, is_done=False)
+    received = []
+
+    async def interrupt():
+        loop = asyncio.get_running_loop()
+        loop.add_signal_handler(signal.SIGINT, received.append, "app")
+        try:
+            with question_module._exit_on_sigint(application):
+                await asyncio.sleep(0)
+            os.kill(os.getpid(), signal.SIGINT)
+            await asyncio.sleep(0.1)
+        finally:
+            loop.remove_signal_handler(signal.SIGINT)
+
+    asyncio.new_event_loop().run_until_complete(interrupt())
+
+    assert received == ["app"]
+    application.exit.assert_not_called()
+
+
+def test_async_skipping_of_questions():
+    loop = asyncio.new_event_loop()
+
+    def run(inp):
+        question = text("Hello?", input=inp, output=DummyOutput()).skip_if(
+            condition=True, default=42
+        )
+        response = loop.run_until_complete(question.ask_async())
+        assert response == 42
+
+    execute_with_input_pipe(run)
+
+
 def test_multiline_text():
     def run(inp):
         inp.send_text(f"Hello{KeyInputs.ENTER}world{KeyInputs.ESCAPE}{KeyInputs.ENTER}")
@@ -1,4 +1,13 @@
+import functools
+from unittest.mock import Mock
+
+import pytest
+from prompt_toolkit.formatted_text import FormattedText
+from prompt_toolkit.styles import Style
+
 from questionary import utils
+from questionary.constants import DEFAULT_STYLE
+from questionary.styles import merge_styles_default
 
 
 def test_default_values_of():
@@ -95,3 +104,137 @@ def test_missing_arguments_of_no_args():
 
     defaults = utils.missing_arguments(f, {})
     assert defaults == set()
+
+
+def test_arguments_of_partial():
+    def f(a, b, c=None):
+        pass
+
+    partial = functools.partial(f, 1)
+    assert utils.arguments_of(partial) == ["b", "c"]
+    assert utils.required_arguments(partial) == ["b"]
+
+
+def test_arguments_of_builtin():
+    # builtins can not be weakly referenced, so they bypass the parameter cache
+    assert utils.arguments_of(divmod) == ["x", "y"]
+    assert utils.required_arguments(divmod) == []
+
+
+def test_print_question_answer(monkeypatch):
+    mock = Mock(return_value=None)
+    monkeypatch.setattr(utils, "print_formatted_text", mock)
+
+    utils.print_question_answer("Hello?", "World")
+
+    mock.assert_called_once_with(
+        FormattedText(
+            [
+                ("class:qmark", "?"),
+                ("class:question", " Hello? "),
+                ("class:answer", "World "),
+            ]
+        ),
+        style=DEFAULT_STYLE,
+    )
+
+
+def test_print_question_answer_with_style(monkeypatch):
+    mock = Mock(return_value=None)
+    monkeypatch.setattr(utils, "print_formatted_text", mock)
+    style = Style([("answer", "bold")])
+
+    utils.print_question_answer("Hello?", "World", style=style)
+
+    merged_style = mock.call_args.kwargs["style"]
+    assert merged_style.get_attrs_for_style_str("class:answer").bold
+
+
+def test_print_question_answer_with_merged_style(monkeypatch):
+    mock = Mock(return_value=None)
+    monkeypatch.setattr(utils, "print_formatted_text", mock)
+    merged_style = merge_styles_default([Style([("answer", "bold")])])
+
+    utils.print_question_answer("Hello?", "World", merged_style=merged_style)
+    utils.print_question_answer("Hi?", "There", merged_style=merged_style)
+
+    assert [c.kwargs["style"] for c in mock.call_args_list] == [merged_style] * 2
+
+
+def test_print_question_answer_non_string_answer(monkeypatch):
+    mock = Mock(return_value=None)
+    monkeypatch.setattr(utils, "print_formatted_text", mock)
+
+    utils.print_question_answer("Toppings?", ["ham", "cheese"])
+    utils.print_question_answer("Toppings?", ["ham", "cheese"])
+
+    first, second = (c.args[0] for c in mock.call_args_list)
+    assert first[-1] == ("class:answer", "['ham', 'cheese'] ")
+    assert first is second
+
+
+def test_print_question_answer_reuses_merged_style(monkeypatch):
+    mock = Mock(return_value=None)
+    monkeypatch.setattr(utils, "print_formatted_text", mock)
+    style = Style([("answer", "bold")])
+
+    utils.print_question_answer("Hello?", "World", style=style)
+    utils.print_question_answer("Hi?", "There", style=style)
+    utils.print_question_answer("Hi?", "There", style=Style([]))
+
+    first, second, third = (c.kwargs["style"] for c in mock.call_args_list)
+    assert first is second
+    assert third is not first
+
+
+@pytest.mark.skipif(not utils.is_prompt_toolkit_3(), reason="requires prompt_toolkit 3")
+def test_async_mode_activated_on_prompt_toolkit_3():
+    assert utils._AsyncState.activated
+
+    utils.activate_prompt_toolkit_async_mode()
+    assert utils._AsyncState.activated
+
+
+def test_arguments_of_positional_and_keyword_only():
+    def f(a, /, b, c=3, *args, d, e=5, **kwargs):
+        pass
+
+    assert utils.arguments_of(f) == ["a", "b", "c", "args", "d", "e", "kwargs"]
+    assert utils.default_values_of(f) == ["a", "c", "args", "d", "e", "kwargs"]
+    assert utils.required_arguments(f) == ["a"]
+    assert utils.missing_arguments(f, {}) == {"a"}
+    assert utils.missing_arguments(f, {"a": 1, "d": 4}) == set()
+
+
+def test_required_arguments_of_positional_only():
+    def f(a, /, b):
+        pass
+
+    assert utils.default_values_of(f) == ["a"]
+    assert utils.required_arguments(f) == ["a"]
+    assert utils.missing_arguments(f, {}) == {"a"}
+
+
+def test_required_arguments_of_keyword_only():
+    def f(a, *, b):
+        pass
+
+    assert utils.default_values_of(f) == ["b"]
+    assert utils.required_arguments(f) == ["a"]
+    assert utils.missing_arguments(f, {}) == {"a"}
+
+
+def test_print_question_answer_uses_format(monkeypatch):
+    mock = Mock(return_value=None)
+    monkeypatch.setattr(utils, "print_formatted_text", mock)
+
+    class Answer:
+        def __format__(self, format_spec):
+            return "formatted"
+
+        def __str__(self):
+            return "str"
+
+    utils.print_question_answer("Hello?", Answer())
+
+    assert mock.call_args.args[0][-1] == ("class:answer", "formatted ")